@@ -3,7 +3,9 @@ Command-line interface for Neo4j operations.
 """
 
 import argparse
-import sys, readline
+import io
+import sys
+import threading
 from typing import Optional
 
 from .database import Neo4jManager
@@ -11,9 +13,8 @@ from .config import Neo4jConfig
 from .examples import create_sample_data, query_examples, graph_analysis_examples
 
 
-def test_connection() -> None:
+def test_connection(manager: Neo4jManager) -> None:
     """Test the Neo4j connection."""
-    manager = Neo4jManager()
     if manager.test_connection():
         print("✅ Connection successful!")
         
@@ -28,9 +29,8 @@ def test_connection() -> None:
         sys.exit(1)
 
 
-def clear_database() -> None:
+def clear_database(manager: Neo4jManager) -> None:
     """Clear all data from the database."""
-    manager = Neo4jManager()
     if manager.test_connection():
         confirm = input("Are you sure you want to clear all data? (yes/no): ")
         if confirm.lower() == 'yes':
@@ -43,55 +43,178 @@ def clear_database() -> None:
         sys.exit(1)
 
 
-def run_examples() -> None:
+def run_examples(manager: Neo4jManager) -> None:
     """Run the example scripts."""
     from .examples import main
-    main()
+    main(manager)
 
 
-def interactive_mode() -> None:
+# REPL commands, keyed on the first (lowercased) token of the input line
+# so arbitrarily long Cypher never pays a whole-string .lower() copy
+_EXIT_COMMANDS = frozenset({"quit", "exit", "q"})
+_HELP_COMMAND = "help"
+
+
+def _start_early_input_capture() -> Optional[tuple]:
+    """Begin buffering keystrokes typed before the first prompt appears.
+
+    Puts the terminal into cbreak mode and drains stdin from a background
+    thread so characters typed during the connection handshake aren't
+    dropped. Returns None (no-op) when stdin isn't a TTY.
+    """
+    if not sys.stdin.isatty():
+        return None
+
+    import os
+    import select
+    import termios
+    import tty
+    from collections import deque
+
+    try:
+        old_attrs = termios.tcgetattr(sys.stdin)
+        tty.setcbreak(sys.stdin.fileno())
+    except (termios.error, OSError):
+        return None
+
+    buffered: deque = deque()
+    stop = threading.Event()
+
+    def _drain() -> None:
+        # Read the raw fd: TextIOWrapper.read(1) would slurp every
+        # available byte into its own buffer, leaving select unaware of
+        # them and stranding all but the first keystroke
+        while not stop.is_set():
+            ready, _, _ = select.select([sys.stdin], [], [], 0.05)
+            if ready:
+                buffered.append(os.read(sys.stdin.fileno(), 1))
+
+    thread = threading.Thread(target=_drain, daemon=True)
+    thread.start()
+    return (buffered, stop, thread, old_attrs)
+
+
+def _finish_early_input_capture(capture: Optional[tuple]) -> None:
+    """Restore cooked mode and pre-seed readline with buffered keystrokes."""
+    if capture is None:
+        return
+
+    import readline
+    import termios
+
+    buffered, stop, thread, old_attrs = capture
+    stop.set()
+    thread.join()
+    termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_attrs)
+
+    decoded = b"".join(buffered).decode("utf-8", errors="ignore")
+    text = "".join(ch for ch in decoded if ch.isprintable())
+    if not text:
+        return
+
+    def _preload() -> None:
+        readline.insert_text(text)
+        readline.redisplay()
+        readline.set_pre_input_hook(None)
+
+    readline.set_pre_input_hook(_preload)
+
+
+def _start_keepalive(manager: Neo4jManager) -> threading.Event:
+    """Ping the server periodically so the Bolt connection never idles out.
+
+    Long pauses between REPL queries can outlast the server's idle
+    timeout, making the next query pay a fresh handshake. A daemon
+    thread issues a trivial query every 30s until the returned event is
+    set.
+    """
+    stop = threading.Event()
+
+    def _ping() -> None:
+        while not stop.wait(30.0):
+            try:
+                manager.connection.execute_query("RETURN 1")
+            except Exception:
+                pass
+
+    threading.Thread(target=_ping, daemon=True).start()
+    return stop
+
+
+def interactive_mode(manager: Neo4jManager) -> None:
     """Start interactive mode for running Cypher queries."""
-    manager = Neo4jManager()
-    
-    if not manager.test_connection():
+    import readline  # noqa: F401 - enables line editing/history for input()
+
+    capture = _start_early_input_capture()
+    try:
+        connected = manager.test_connection()
+    finally:
+        # Restore cooked mode even if the handshake is interrupted
+        # (e.g. Ctrl-C), so the terminal isn't left in cbreak/no-echo
+        _finish_early_input_capture(capture)
+
+    if not connected:
         print("❌ Cannot connect to database!")
         sys.exit(1)
-    
+
+    from neo4j.exceptions import SessionExpired
+
+    keepalive_stop = _start_keepalive(manager)
+
     print("=== Neo4j Interactive Mode ===")
     print("Enter Cypher queries (type 'quit' to exit)")
     print("Type 'help' for some example queries\n")
-    
-    with manager.connection:
+
+    def run_and_print(query: str) -> None:
+        # Execute query, buffering output into a single write so slow
+        # TTYs pay one flush instead of one per record
+        buf = io.StringIO()
+        count = 0
+        for count, result in enumerate(
+            manager.connection.iter_query(query), 1
+        ):
+            buf.write(f"  {count}. {result}\n")
+
+        if count:
+            sys.stdout.write(f"\nResults ({count} records):\n")
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+        else:
+            print("No results returned.")
+
+    try:
         while True:
             try:
                 query = input("neo4j> ").strip()
-                
-                if query.lower() in ['quit', 'exit', 'q']:
+
+                if not query:
+                    continue
+
+                first_token = query.split(None, 1)[0].lower()
+
+                if first_token in _EXIT_COMMANDS:
                     print("Goodbye!")
                     break
-                
-                if query.lower() == 'help':
+
+                if first_token == _HELP_COMMAND:
                     print_help()
                     continue
-                
-                if not query:
-                    continue
-                
-                # Execute query
-                results = manager.connection.execute_query(query)
-                
-                if results:
-                    print(f"\nResults ({len(results)} records):")
-                    for i, result in enumerate(results, 1):
-                        print(f"  {i}. {result}")
-                else:
-                    print("No results returned.")
-                    
+
+                try:
+                    run_and_print(query)
+                except SessionExpired:
+                    # Session went stale (e.g. idle timeout); reopen once
+                    manager.connection.close_session()
+                    run_and_print(query)
+
             except KeyboardInterrupt:
                 print("\nGoodbye!")
                 break
             except Exception as e:
                 print(f"Error: {e}")
+    finally:
+        keepalive_stop.set()
+        manager.connection.close_session()
 
 
 def print_help() -> None:
@@ -110,8 +233,29 @@ Example queries:
     print(help_text)
 
 
+def _dispatch(command: str, config: Optional[Neo4jConfig]) -> None:
+    """Run a CLI command with the given configuration."""
+    # One manager (and one driver) shared by all commands
+    manager = Neo4jManager(config)
+
+    if command == 'test':
+        test_connection(manager)
+    elif command == 'examples':
+        run_examples(manager)
+    elif command == 'interactive':
+        interactive_mode(manager)
+    elif command == 'clear':
+        clear_database(manager)
+
+
 def main() -> None:
     """Main CLI function."""
+    # Fast path: a bare command needs no flag parsing, so skip building
+    # the ArgumentParser entirely
+    if len(sys.argv) == 2 and sys.argv[1] in ('test', 'examples', 'interactive', 'clear'):
+        _dispatch(sys.argv[1], Neo4jConfig.from_env())
+        return
+
     parser = argparse.ArgumentParser(
         description="Neo4j Learning CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -149,28 +293,27 @@ Examples:
         '--database',
         help='Neo4j database name (default: neo4j)'
     )
-    
+
+    parser.add_argument(
+        '--warmup',
+        action='store_true',
+        help='Warm the Neo4j page cache on connect (requires APOC)'
+    )
+
     args = parser.parse_args()
-    
-    # Create custom config if arguments provided
-    config = None
-    if any([args.uri, args.username, args.password, args.database]):
-        config = Neo4jConfig(
-            uri=args.uri,
-            username=args.username,
-            password=args.password,
-            database=args.database
-        )
-    
-    # Execute command
-    if args.command == 'test':
-        test_connection()
-    elif args.command == 'examples':
-        run_examples()
-    elif args.command == 'interactive':
-        interactive_mode()
-    elif args.command == 'clear':
-        clear_database()
+
+    # Pass only the fields the user actually overrode; everything else
+    # inherits the cached env-derived defaults
+    overrides = {
+        key: value
+        for key, value in vars(args).items()
+        if key in {"uri", "username", "password", "database"} and value is not None
+    }
+    if args.warmup:
+        overrides["warmup"] = True
+    config = Neo4jConfig(**overrides) if overrides else Neo4jConfig.from_env()
+
+    _dispatch(args.command, config)
 
 
 if __name__ == "__main__":
@@ -2,46 +2,92 @@
 Configuration module for Neo4j connection settings.
 """
 
+import functools
 import os
+from dataclasses import dataclass, field
 from typing import Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
 
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> None:
+    """Load variables from a .env file, at most once per process.
 
-class Neo4jConfig:
-    """Configuration class for Neo4j connection settings."""
-    
-    def __init__(
-        self,
-        uri: Optional[str] = None,
-        username: Optional[str] = None,
-        password: Optional[str] = None,
-        database: Optional[str] = None,
+    Skipped entirely when all connection settings are already present in
+    the environment, avoiding the file I/O and the dotenv import.
+    """
+    if all(
+        os.environ.get(key)
+        for key in ("NEO4J_URI", "NEO4J_USERNAME", "NEO4J_PASSWORD", "NEO4J_DATABASE")
     ):
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@dataclass(frozen=True)
+class Neo4jConfig:
+    """Configuration class for Neo4j connection settings.
+
+    Frozen so instances are hashable and safe to share (e.g. via
+    :meth:`from_env`); any field left as None is resolved from the
+    environment in ``__post_init__``.
+    """
+
+    uri: Optional[str] = None
+    username: Optional[str] = None
+    password: Optional[str] = field(default=None, repr=False)
+    database: Optional[str] = None
+    max_connection_pool_size: Optional[int] = None
+    connection_acquisition_timeout: Optional[float] = None
+    warmup: Optional[bool] = None
+
+    def __post_init__(self) -> None:
+        """Fill in any unset fields from environment variables."""
+        _load_env_once()
+        if self.uri is None:
+            object.__setattr__(
+                self, "uri", os.getenv("NEO4J_URI", "bolt://localhost:7687")
+            )
+        if self.username is None:
+            object.__setattr__(
+                self, "username", os.getenv("NEO4J_USERNAME", "neo4j")
+            )
+        if self.password is None:
+            object.__setattr__(
+                self, "password", os.getenv("NEO4J_PASSWORD", "password")
+            )
+        if self.database is None:
+            object.__setattr__(
+                self, "database", os.getenv("NEO4J_DATABASE", "neo4j")
+            )
+        if self.max_connection_pool_size is None:
+            object.__setattr__(
+                self,
+                "max_connection_pool_size",
+                int(os.getenv("NEO4J_MAX_POOL_SIZE", "50")),
+            )
+        if self.connection_acquisition_timeout is None:
+            object.__setattr__(
+                self,
+                "connection_acquisition_timeout",
+                float(os.getenv("NEO4J_ACQ_TIMEOUT", "60.0")),
+            )
+        if self.warmup is None:
+            object.__setattr__(
+                self, "warmup", os.getenv("NEO4J_WARMUP", "0") == "1"
+            )
+
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def from_env(cls) -> "Neo4jConfig":
+        """Return the environment-derived configuration, cached per process.
+
+        Use this instead of ``Neo4jConfig()`` when no explicit overrides
+        are needed, so the env vars are only read once.
         """
-        Initialize Neo4j configuration.
-        
-        Args:
-            uri: Neo4j connection URI
-            username: Neo4j username
-            password: Neo4j password
-            database: Neo4j database name
-        """
-        self.uri = uri or os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        self.username = username or os.getenv("NEO4J_USERNAME", "neo4j")
-        self.password = password or os.getenv("NEO4J_PASSWORD", "password")
-        self.database = database or os.getenv("NEO4J_DATABASE", "neo4j")
-    
-    def __repr__(self) -> str:
-        """String representation of the configuration."""
-        return (
-            f"Neo4jConfig(uri='{self.uri}', "
-            f"username='{self.username}', "
-            f"database='{self.database}')"
-        )
+        return cls()
 
 
 # Default configuration instance
-default_config = Neo4jConfig() 
\ No newline at end of file
+default_config = Neo4jConfig.from_env() 
\ No newline at end of file
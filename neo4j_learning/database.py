@@ -2,12 +2,14 @@
 Database connection module for Neo4j.
 """
 
-from typing import Optional, Dict, Any, List
-from neo4j import GraphDatabase, Driver, Session
-from neo4j.exceptions import ServiceUnavailable, AuthError
+import atexit
+from typing import TYPE_CHECKING, Iterator, Optional, Dict, Any, List
 
 from .config import Neo4jConfig
 
+if TYPE_CHECKING:
+    from neo4j import Driver, Session
+
 
 class Neo4jConnection:
     """Neo4j database connection manager."""
@@ -19,28 +21,57 @@ class Neo4jConnection:
         Args:
             config: Neo4j configuration object
         """
-        self.config = config or Neo4jConfig()
-        self.driver: Optional[Driver] = None
+        self.config = config or Neo4jConfig.from_env()
+        self.driver: Optional["Driver"] = None
+        self._session: Optional["Session"] = None
     
     def connect(self) -> None:
-        """Establish connection to Neo4j database."""
+        """Establish connection to Neo4j database.
+
+        Idempotent: if a driver already exists it is reused, so repeated
+        calls do not pay the TCP/TLS handshake again.
+        """
+        if self.driver is not None:
+            return
+
+        # Imported here so config-only code paths (--help, tests) never
+        # pay for loading the full neo4j driver package
+        from neo4j import GraphDatabase
+        from neo4j.exceptions import ServiceUnavailable, AuthError
+
         try:
             self.driver = GraphDatabase.driver(
                 self.config.uri,
-                auth=(self.config.username, self.config.password)
+                auth=(self.config.username, self.config.password),
+                max_connection_pool_size=self.config.max_connection_pool_size,
+                connection_acquisition_timeout=self.config.connection_acquisition_timeout,
+                connection_timeout=30.0,
+                max_transaction_retry_time=30.0,
+                keep_alive=True,
             )
             # Verify connection
             self.driver.verify_connectivity()
             print(f"Successfully connected to Neo4j at {self.config.uri}")
+            atexit.register(self._shutdown)
         except ServiceUnavailable as e:
             print(f"Failed to connect to Neo4j: {e}")
             raise
         except AuthError as e:
             print(f"Authentication failed: {e}")
             raise
-    
+
     def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connection.
+
+        The driver is kept open for reuse; the actual teardown happens
+        at process exit via :func:`atexit.register`.
+        """
+
+    def _shutdown(self) -> None:
+        """Close the underlying driver (called at process exit)."""
+        if self._session:
+            self._session.close()
+            self._session = None
         if self.driver:
             self.driver.close()
             self.driver = None
@@ -72,11 +103,105 @@ class Neo4jConnection:
         """
         if not self.driver:
             raise RuntimeError("Database not connected. Call connect() first.")
-        
-        with self.driver.session(database=self.config.database) as session:
+
+        from neo4j import RoutingControl
+
+        records, _, _ = self.driver.execute_query(
+            query,
+            parameters or {},
+            database_=self.config.database,
+            routing_=RoutingControl.READ,
+        )
+        return [record.data() for record in records]
+    
+    def iter_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute a Cypher query and stream its results.
+
+        Records are yielded as they arrive from the server rather than
+        being materialized up front, overlapping Python-side processing
+        with the Bolt fetch and keeping peak memory flat.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Yields:
+            Result records, one at a time
+        """
+        result = self.open_session().run(query, parameters or {})
+        for record in result:
+            yield record.data()
+
+    def warm_cache(self) -> None:
+        """Pre-load the server's page cache via apoc.warmup.run.
+
+        Best effort: a missing APOC install or unreachable server is
+        reported and otherwise ignored, so warmup never blocks startup.
+        """
+        try:
+            self.connect()
+            self.execute_query("CALL apoc.warmup.run(true, true, true)")
+            print("Page cache warmed up")
+        except Exception as e:
+            print(f"Cache warmup skipped: {e}")
+
+    def open_session(self) -> "Session":
+        """
+        Return a long-lived session, creating it on first use.
+
+        The session is kept on the connection and reused across calls
+        (e.g. successive REPL queries), so each query skips the
+        connection-pool acquire/release cycle.
+
+        Returns:
+            The shared Session instance
+        """
+        if not self.driver:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        if self._session is None:
+            self._session = self.driver.session(
+                database=self.config.database,
+                fetch_size=1000,
+            )
+        return self._session
+
+    def close_session(self) -> None:
+        """Close the shared session so the next use opens a fresh one."""
+        if self._session:
+            self._session.close()
+            self._session = None
+
+    def system_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute an administrative query against the system database.
+
+        Naming the database explicitly skips the extra round-trip the
+        driver otherwise makes to resolve the home database.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Returns:
+            List of result records
+        """
+        if not self.driver:
+            raise RuntimeError("Database not connected. Call connect() first.")
+
+        with self.driver.session(database="system") as session:
             result = session.run(query, parameters or {})
             return [record.data() for record in result]
-    
+
     def execute_write_query(
         self, 
         query: str, 
@@ -94,13 +219,16 @@ class Neo4jConnection:
         """
         if not self.driver:
             raise RuntimeError("Database not connected. Call connect() first.")
-        
-        with self.driver.session(database=self.config.database) as session:
-            with session.begin_transaction() as tx:
-                result = tx.run(query, parameters or {})
-                records = [record.data() for record in result]
-                tx.commit()
-                return records
+
+        from neo4j import RoutingControl
+
+        records, _, _ = self.driver.execute_query(
+            query,
+            parameters or {},
+            database_=self.config.database,
+            routing_=RoutingControl.WRITE,
+        )
+        return [record.data() for record in records]
 
 
 class Neo4jManager:
@@ -114,18 +242,24 @@ class Neo4jManager:
             config: Neo4j configuration object
         """
         self.connection = Neo4jConnection(config)
-    
+        if self.connection.config.warmup:
+            self.connection.warm_cache()
+
     def test_connection(self) -> bool:
         """
         Test the database connection.
-        
+
+        Relies on the driver's verify_connectivity (a single Bolt HELLO)
+        rather than issuing a throwaway query round-trip.
+
         Returns:
             True if connection is successful, False otherwise
         """
         try:
-            with self.connection:
-                result = self.connection.execute_query("RETURN 1 as test")
-                return len(result) > 0 and result[0]["test"] == 1
+            self.connection.connect()
+            if self.connection.driver is not None:
+                self.connection.driver.verify_connectivity()
+            return True
         except Exception as e:
             print(f"Connection test failed: {e}")
             return False
@@ -137,14 +271,27 @@ class Neo4jManager:
         Returns:
             Dictionary containing database information
         """
-        with self.connection:
-            result = self.connection.execute_query(
-                "CALL dbms.components() YIELD name, versions, edition"
-            )
-            return result[0] if result else {}
-    
+        self.connection.connect()
+        result = self.connection.system_query(
+            "CALL dbms.components() YIELD name, versions, edition"
+        )
+        return result[0] if result else {}
+
     def clear_database(self) -> None:
-        """Clear all data from the database."""
-        with self.connection:
+        """Clear all data from the database.
+
+        Deletes in batches via apoc.periodic.iterate so large graphs
+        don't build one enormous transaction; falls back to a plain
+        DETACH DELETE when APOC is not installed.
+        """
+        self.connection.connect()
+        try:
+            self.connection.execute_write_query(
+                "CALL apoc.periodic.iterate("
+                "'MATCH (n) RETURN n', "
+                "'DETACH DELETE n', "
+                "{batchSize: 10000, parallel: false})"
+            )
+        except Exception:
             self.connection.execute_write_query("MATCH (n) DETACH DELETE n")
-            print("Database cleared") 
\ No newline at end of file
+        print("Database cleared") 
\ No newline at end of file
@@ -2,218 +2,247 @@
 Example scripts demonstrating basic Neo4j operations.
 """
 
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Tuple
 from .database import Neo4jManager
 from .config import Neo4jConfig
 
-
-def create_sample_data() -> None:
-    """Create sample data in the database."""
-    manager = Neo4jManager()
-    
-    # Sample data creation queries
-    queries = [
-        # Create some people
+# Example queries built once at import; tuples so they're immutable and
+# shared across repeated example runs
+_QUERY_EXAMPLES: Tuple[Dict[str, str], ...] = (
+    {
+        "name": "Find all people",
+        "query": "MATCH (p:Person) RETURN p.name, p.age, p.city ORDER BY p.name"
+    },
+    {
+        "name": "Find all companies",
+        "query": "MATCH (c:Company) RETURN c.name, c.industry ORDER BY c.name"
+    },
+    {
+        "name": "Find people who work for companies",
+        "query": """
+        MATCH (p:Person)-[r:WORKS_FOR]->(c:Company)
+        RETURN p.name, c.name, r.position, r.since
+        ORDER BY p.name
         """
-        CREATE (alice:Person {name: 'Alice', age: 30, city: 'New York'})
-        CREATE (bob:Person {name: 'Bob', age: 25, city: 'San Francisco'})
-        CREATE (charlie:Person {name: 'Charlie', age: 35, city: 'Chicago'})
-        CREATE (diana:Person {name: 'Diana', age: 28, city: 'Boston'})
-        """,
-        
-        # Create some companies
+    },
+    {
+        "name": "Find friends of Alice",
+        "query": """
+        MATCH (alice:Person {name: 'Alice'})-[:FRIENDS_WITH]-(friend:Person)
+        RETURN friend.name, friend.city
+        ORDER BY friend.name
         """
-        CREATE (techcorp:Company {name: 'TechCorp', industry: 'Technology'})
-        CREATE (dataflow:Company {name: 'DataFlow', industry: 'Data Analytics'})
-        CREATE (innovate:Company {name: 'Innovate Inc', industry: 'Consulting'})
-        """,
-        
-        # Create relationships
+    },
+    {
+        "name": "Count relationships by type",
+        "query": """
+        MATCH ()-[r]->()
+        RETURN type(r) as relationship_type, count(r) as count
+        ORDER BY count DESC
         """
-        MATCH (alice:Person {name: 'Alice'})
-        MATCH (techcorp:Company {name: 'TechCorp'})
-        CREATE (alice)-[:WORKS_FOR {since: 2020, position: 'Software Engineer'}]->(techcorp)
-        """,
-        
-        """
-        MATCH (bob:Person {name: 'Bob'})
-        MATCH (dataflow:Company {name: 'DataFlow'})
-        CREATE (bob)-[:WORKS_FOR {since: 2021, position: 'Data Scientist'}]->(dataflow)
-        """,
-        
+    },
+    {
+        "name": "Find people in the same city",
+        "query": """
+        MATCH (p1:Person)-[:FRIENDS_WITH]-(p2:Person)
+        WHERE p1.city = p2.city
+        RETURN p1.name, p2.name, p1.city
+        ORDER BY p1.city, p1.name
         """
-        MATCH (charlie:Person {name: 'Charlie'})
-        MATCH (innovate:Company {name: 'Innovate Inc'})
-        CREATE (charlie)-[:WORKS_FOR {since: 2019, position: 'Senior Consultant'}]->(innovate)
-        """,
-        
-        # Create friendships
+    },
+)
+
+_ANALYSIS_QUERIES: Tuple[Dict[str, str], ...] = (
+    {
+        "name": "Degree centrality (number of connections)",
+        "query": """
+        MATCH (n:Person)
+        OPTIONAL MATCH (n)-[r]-()
+        RETURN n.name, count(r) as degree
+        ORDER BY degree DESC
         """
-        MATCH (alice:Person {name: 'Alice'})
-        MATCH (bob:Person {name: 'Bob'})
-        CREATE (alice)-[:FRIENDS_WITH {since: 2018}]->(bob)
-        """,
-        
+    },
+    {
+        "name": "Find the most connected person",
+        "query": """
+        MATCH (n:Person)
+        OPTIONAL MATCH (n)-[r]-()
+        WITH n, count(r) as connections
+        ORDER BY connections DESC
+        LIMIT 1
+        RETURN n.name, connections
         """
-        MATCH (bob:Person {name: 'Bob'})
-        MATCH (charlie:Person {name: 'Charlie'})
-        CREATE (bob)-[:FRIENDS_WITH {since: 2020}]->(charlie)
-        """,
-        
+    },
+    {
+        "name": "Find people working in technology companies",
+        "query": """
+        MATCH (p:Person)-[:WORKS_FOR]->(c:Company)
+        WHERE c.industry = 'Technology'
+        RETURN p.name, c.name, c.industry
+        ORDER BY p.name
         """
-        MATCH (alice:Person {name: 'Alice'})
-        MATCH (diana:Person {name: 'Diana'})
-        CREATE (alice)-[:FRIENDS_WITH {since: 2019}]->(diana)
+    },
+    {
+        "name": "Find mutual friends",
+        "query": """
+        MATCH (p1:Person)-[:FRIENDS_WITH]-(mutual:Person)-[:FRIENDS_WITH]-(p2:Person)
+        WHERE p1 <> p2
+        RETURN p1.name, p2.name, collect(mutual.name) as mutual_friends
+        ORDER BY size(collect(mutual.name)) DESC
         """
-    ]
-    
-    with manager.connection:
-        for i, query in enumerate(queries, 1):
-            print(f"Executing query {i}...")
-            manager.connection.execute_write_query(query)
-    
-    print("Sample data created successfully!")
+    },
+)
 
 
-def query_examples() -> None:
-    """Demonstrate various query examples."""
-    manager = Neo4jManager()
-    
-    examples = [
-        {
-            "name": "Find all people",
-            "query": "MATCH (p:Person) RETURN p.name, p.age, p.city ORDER BY p.name"
-        },
-        {
-            "name": "Find all companies",
-            "query": "MATCH (c:Company) RETURN c.name, c.industry ORDER BY c.name"
-        },
-        {
-            "name": "Find people who work for companies",
-            "query": """
-            MATCH (p:Person)-[r:WORKS_FOR]->(c:Company)
-            RETURN p.name, c.name, r.position, r.since
-            ORDER BY p.name
-            """
-        },
-        {
-            "name": "Find friends of Alice",
-            "query": """
-            MATCH (alice:Person {name: 'Alice'})-[:FRIENDS_WITH]-(friend:Person)
-            RETURN friend.name, friend.city
-            ORDER BY friend.name
-            """
-        },
-        {
-            "name": "Count relationships by type",
-            "query": """
-            MATCH ()-[r]->()
-            RETURN type(r) as relationship_type, count(r) as count
-            ORDER BY count DESC
-            """
-        },
-        {
-            "name": "Find people in the same city",
-            "query": """
-            MATCH (p1:Person)-[:FRIENDS_WITH]-(p2:Person)
-            WHERE p1.city = p2.city
-            RETURN p1.name, p2.name, p1.city
-            ORDER BY p1.city, p1.name
-            """
+def _run_queries_concurrently(
+    manager: Neo4jManager, queries: Tuple[Dict[str, str], ...]
+) -> None:
+    """Run independent read queries in parallel and print each result set.
+
+    Each worker thread checks out its own pooled connection, so wall-clock
+    time approaches the slowest single query rather than the sum.
+    """
+    with ThreadPoolExecutor(max_workers=min(len(queries), 8)) as pool:
+        futures = {
+            pool.submit(manager.connection.execute_query, q["query"]): q
+            for q in queries
         }
-    ]
-    
-    with manager.connection:
-        for example in examples:
-            print(f"\n=== {example['name']} ===")
+        for future in as_completed(futures):
+            query = futures[future]
+            print(f"\n=== {query['name']} ===")
             try:
-                results = manager.connection.execute_query(example['query'])
-                for result in results:
+                for result in future.result():
                     print(result)
             except Exception as e:
                 print(f"Error executing query: {e}")
 
 
-def graph_analysis_examples() -> None:
-    """Demonstrate graph analysis queries."""
-    manager = Neo4jManager()
-    
-    analysis_queries = [
-        {
-            "name": "Degree centrality (number of connections)",
-            "query": """
-            MATCH (n:Person)
-            OPTIONAL MATCH (n)-[r]-()
-            RETURN n.name, count(r) as degree
-            ORDER BY degree DESC
-            """
-        },
-        {
-            "name": "Find the most connected person",
-            "query": """
-            MATCH (n:Person)
-            OPTIONAL MATCH (n)-[r]-()
-            WITH n, count(r) as connections
-            ORDER BY connections DESC
-            LIMIT 1
-            RETURN n.name, connections
-            """
-        },
-        {
-            "name": "Find people working in technology companies",
-            "query": """
-            MATCH (p:Person)-[:WORKS_FOR]->(c:Company)
-            WHERE c.industry = 'Technology'
-            RETURN p.name, c.name, c.industry
-            ORDER BY p.name
-            """
-        },
-        {
-            "name": "Find mutual friends",
-            "query": """
-            MATCH (p1:Person)-[:FRIENDS_WITH]-(mutual:Person)-[:FRIENDS_WITH]-(p2:Person)
-            WHERE p1 <> p2
-            RETURN p1.name, p2.name, collect(mutual.name) as mutual_friends
-            ORDER BY size(collect(mutual.name)) DESC
-            """
-        }
+def _ensure_indexes(manager: Neo4jManager) -> None:
+    """Create uniqueness constraints (and their backing indexes) on name lookups."""
+    try:
+        manager.connection.execute_write_query(
+            "CREATE CONSTRAINT person_name IF NOT EXISTS "
+            "FOR (p:Person) REQUIRE p.name IS UNIQUE"
+        )
+        manager.connection.execute_write_query(
+            "CREATE CONSTRAINT company_name IF NOT EXISTS "
+            "FOR (c:Company) REQUIRE c.name IS UNIQUE"
+        )
+    except Exception as e:
+        # Likely duplicate names from earlier runs; the MERGE-based load
+        # works without the constraints, just via label scans
+        print(f"Could not create uniqueness constraints: {e}")
+
+
+def create_sample_data(manager: Optional[Neo4jManager] = None) -> None:
+    """Create sample data in the database."""
+    manager = manager or Neo4jManager()
+
+    # Sample data as plain Python rows, batched into UNWIND queries so
+    # each entity type costs a single commit round-trip
+    people = [
+        {"name": "Alice", "age": 30, "city": "New York"},
+        {"name": "Bob", "age": 25, "city": "San Francisco"},
+        {"name": "Charlie", "age": 35, "city": "Chicago"},
+        {"name": "Diana", "age": 28, "city": "Boston"},
     ]
-    
-    with manager.connection:
-        for analysis in analysis_queries:
-            print(f"\n=== {analysis['name']} ===")
-            try:
-                results = manager.connection.execute_query(analysis['query'])
-                for result in results:
-                    print(result)
-            except Exception as e:
-                print(f"Error executing analysis: {e}")
+    companies = [
+        {"name": "TechCorp", "industry": "Technology"},
+        {"name": "DataFlow", "industry": "Data Analytics"},
+        {"name": "Innovate Inc", "industry": "Consulting"},
+    ]
+    works_for = [
+        {"person": "Alice", "company": "TechCorp", "since": 2020, "position": "Software Engineer"},
+        {"person": "Bob", "company": "DataFlow", "since": 2021, "position": "Data Scientist"},
+        {"person": "Charlie", "company": "Innovate Inc", "since": 2019, "position": "Senior Consultant"},
+    ]
+    friends = [
+        {"from": "Alice", "to": "Bob", "since": 2018},
+        {"from": "Bob", "to": "Charlie", "since": 2020},
+        {"from": "Alice", "to": "Diana", "since": 2019},
+    ]
+
+    manager.connection.connect()
+    _ensure_indexes(manager)
+
+    print("Creating people...")
+    manager.connection.execute_write_query(
+        "UNWIND $rows AS r MERGE (p:Person {name: r.name}) "
+        "SET p.age = r.age, p.city = r.city",
+        {"rows": people},
+    )
+
+    print("Creating companies...")
+    manager.connection.execute_write_query(
+        "UNWIND $rows AS r MERGE (c:Company {name: r.name}) "
+        "SET c.industry = r.industry",
+        {"rows": companies},
+    )
+
+    print("Creating relationships...")
+    manager.connection.execute_write_query(
+        """
+        UNWIND $rows AS r
+        MATCH (p:Person {name: r.person})
+        MATCH (c:Company {name: r.company})
+        MERGE (p)-[w:WORKS_FOR]->(c)
+        SET w.since = r.since, w.position = r.position
+        """,
+        {"rows": works_for},
+    )
+    manager.connection.execute_write_query(
+        """
+        UNWIND $rows AS r
+        MATCH (p1:Person {name: r.from})
+        MATCH (p2:Person {name: r.to})
+        MERGE (p1)-[f:FRIENDS_WITH]->(p2)
+        SET f.since = r.since
+        """,
+        {"rows": friends},
+    )
+
+    print("Sample data created successfully!")
 
 
-def main() -> None:
+def query_examples(manager: Optional[Neo4jManager] = None) -> None:
+    """Demonstrate various query examples."""
+    manager = manager or Neo4jManager()
+    manager.connection.connect()
+    _run_queries_concurrently(manager, _QUERY_EXAMPLES)
+
+
+def graph_analysis_examples(manager: Optional[Neo4jManager] = None) -> None:
+    """Demonstrate graph analysis queries."""
+    manager = manager or Neo4jManager()
+    manager.connection.connect()
+    _run_queries_concurrently(manager, _ANALYSIS_QUERIES)
+
+
+def main(manager: Optional[Neo4jManager] = None) -> None:
     """Main function to run all examples."""
     print("=== Neo4j Learning Examples ===\n")
-    
-    # Test connection first
-    manager = Neo4jManager()
+
+    # Test connection first, sharing one manager (and driver) throughout
+    manager = manager or Neo4jManager()
     if not manager.test_connection():
         print("Failed to connect to Neo4j. Please ensure Neo4j is running.")
         return
-    
+
     print("Connection successful!\n")
-    
+
     # Create sample data
     print("Creating sample data...")
-    create_sample_data()
-    
+    create_sample_data(manager)
+
     # Run query examples
     print("\nRunning query examples...")
-    query_examples()
-    
+    query_examples(manager)
+
     # Run analysis examples
     print("\nRunning graph analysis examples...")
-    graph_analysis_examples()
-    
+    graph_analysis_examples(manager)
+
     print("\n=== Examples completed ===")
 
 
@@ -50,6 +50,28 @@ class TestNeo4jConfig:
         assert config.password == "envpass"
         assert config.database == "envdb"
     
+    def test_default_pool_config(self):
+        """Test default connection pool settings."""
+        config = Neo4jConfig()
+
+        assert config.max_connection_pool_size == 50
+        assert config.connection_acquisition_timeout == 60.0
+
+    @patch.dict(os.environ, {
+        'NEO4J_MAX_POOL_SIZE': '10',
+        'NEO4J_ACQ_TIMEOUT': '5.5'
+    })
+    def test_pool_config_environment_variables(self):
+        """Test pool settings from environment variables."""
+        config = Neo4jConfig()
+
+        assert config.max_connection_pool_size == 10
+        assert config.connection_acquisition_timeout == 5.5
+
+    def test_from_env_cached(self):
+        """Test that from_env returns the same cached instance."""
+        assert Neo4jConfig.from_env() is Neo4jConfig.from_env()
+
     def test_repr(self):
         """Test string representation."""
         config = Neo4jConfig(